@@ -3,36 +3,48 @@ Copyright (c) IBM 2015-2017. All Rights Reserved.
 Project name: storm-softlayer
 This project is licensed under the MIT License, see LICENSE
 """
+import compileall
 import sys
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 import versioneer
 
+try:
+    from wheel.bdist_wheel import bdist_wheel as _bdist_wheel
+except ImportError:
+    _bdist_wheel = None
 
-needs_pytest = {"pytest", "test", "ptr", "coverage"}.intersection(sys.argv)
+
+_PYTEST_ARGS = frozenset({"pytest", "test", "ptr", "coverage"})
+
+needs_pytest = any(argument in _PYTEST_ARGS for argument in sys.argv)
 pytest_runner = ["pytest-runner"] if needs_pytest else []
 
-setup(
-    author = "IBM",
-    author_email = "",
-    cmdclass=versioneer.get_cmdclass(),
-    description = "Cloud infrastructure driver for SoftLayer",
-    entry_points = {
-        "console_scripts" : [
-            "slcli = storm.drivers.softlayer:slcli"
-        ]
-    },
-    install_requires = [
-        "apache-libcloud",
-        "SoftLayer==5.1"
-    ],
-    keywords = "python storm cloud",
-    license = "MIT",
-    name = "storm-softlayer",
-    packages = find_packages(),
-    url = "",
-    setup_requires=[] + pytest_runner,
-    tests_require=["pytest", "pytest-cov"],
-    version = versioneer.get_version(),
-)
+def get_cmdclass():
+    """
+    Get the versioneer command classes, extended with a bdist_wheel that
+    precompiles bytecode so wheel installs skip the parse+compile cost on
+    first import
+    """
+    cmdclass = versioneer.get_cmdclass()
+    if _bdist_wheel is not None:
+        class bdist_wheel(_bdist_wheel):
+            def run(self):
+                self.run_command("build")
+                build = self.get_finalized_command("build")
+                # the list form of optimize requires Python >= 3.9
+                compileall.compile_dir(build.build_lib, optimize=[0, 1, 2], quiet=1)
+                _bdist_wheel.run(self)
+        cmdclass["bdist_wheel"] = bdist_wheel
+    return cmdclass
+
+if __name__ == "__main__":
+    # static metadata lives in pyproject.toml; only the versioneer-derived
+    # pieces remain dynamic here
+    setup(
+        cmdclass=get_cmdclass(),
+        setup_requires=[] + pytest_runner,
+        tests_require=["pytest", "pytest-cov"],
+        version=versioneer.get_version(),
+    )
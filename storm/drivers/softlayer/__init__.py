@@ -3,22 +3,53 @@ Copyright (c) IBM 2015-2017. All Rights Reserved.
 Project name: storm-softlayer
 This project is licensed under the MIT License, see LICENSE
 """
-from pkgutil import extend_path
+from libcloud.compute.providers import set_driver
 
-from ._version import get_versions
-from .softlayerDriver import (DEFAULT_CPU_SIZE, DEFAULT_DISK_SIZE, DEFAULT_RAM_SIZE,
-                              slcli,
-                              SoftLayerNodeDriver, SoftLayerNodeLocation, SoftLayerNodeSize)
+try:
+    # a release build freezes the version into _version.py so that importing
+    # the package does not have to run the git-based version computation
+    from ._version import __version__
+except ImportError:
+    from ._version import get_versions as _get_versions
+    __version__ = _get_versions().get("version", "0+unknown")
 
+# register the driver with libcloud by dotted path so that importing the
+# package is enough for get_driver("sl") to work while the driver module
+# and its SoftLayer imports are only loaded when the driver is requested
+set_driver("sl", "storm.drivers.softlayer.softlayerDriver", "SoftLayerNodeDriver")
 
-__path__ = extend_path(__path__, __name__)
-
-__version__ = get_versions()['version']
-del get_versions
-
-__all__ = [
+__all__ = (
     "DEFAULT_CPU_SIZE", "DEFAULT_DISK_SIZE", "DEFAULT_RAM_SIZE",
     "slcli",
     "SoftLayerNodeDriver", "SoftLayerNodeLocation", "SoftLayerNodeSize"
-]
+)
+
+# names resolved lazily from the driver module so that importing the package
+# does not pull in the heavyweight libcloud and SoftLayer dependencies
+_LAZY = {
+    "DEFAULT_CPU_SIZE", "DEFAULT_DISK_SIZE", "DEFAULT_RAM_SIZE",
+    "SoftLayerNodeDriver", "SoftLayerNodeLocation", "SoftLayerNodeSize"
+}
+
+def slcli():
+    """
+    Pass-through to SoftLayer commandline client
+    """
+    import SoftLayer.CLI.core
+    SoftLayer.CLI.core.main()
+
+# legacy names kept as aliases for their canonical counterparts
+_ALIASES = {
+    "SoftLayerPythonAPINodeDriver": "SoftLayerNodeDriver"
+}
+
+def __getattr__(name):
+    if name in _LAZY or name in _ALIASES:
+        from . import softlayerDriver
+        value = getattr(softlayerDriver, _ALIASES.get(name, name))
+        globals()[name] = value
+        return value
+    raise AttributeError(name)
 
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
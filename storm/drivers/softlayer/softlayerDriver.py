@@ -5,17 +5,25 @@ This project is licensed under the MIT License, see LICENSE
 
 libcloud driver for the SoftLayer infrastructure
 """
-import ConfigParser
-import copy
+try:
+    import configparser
+except ImportError:
+    import ConfigParser as configparser
 import datetime
+import heapq
+import itertools
 import logging
 import os
+import re
 import string
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, itemgetter
 
 import SoftLayer
 from libcloud.compute.base import (Node, NodeDriver, NodeImage, NodeLocation, NodeSize, NodeState)
-from libcloud.compute.providers import set_driver
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 
 log = logging.getLogger(__name__)
@@ -45,7 +53,10 @@ HARDWARE_INFO_ITEMS = [
 
 IMAGE_INFO_ITEMS = [
     "accountId",
-    "blockDevices,"
+    "blockDevices",
+    # pull the per-datacenter child images and their block devices in the
+    # same call so details never need a follow-up round-trip per child
+    "children[id,blockDevices[id,diskSpace,units,diskImage[capacity,units]]]",
     "createDate",
     "globalIdentifier",
     "id",
@@ -81,6 +92,26 @@ VIRTUAL_INFO_ITEMS = [
     "tagReferences"
 ]
 
+# precomputed mask strings so the repeated callers, in particular the node
+# creation poll loop, do not rebuild them on every call
+HARDWARE_MASK = "[mask[{info}],mask(SoftLayer_Hardware_Server)[{server}]]".format(
+    info=",".join(HARDWARE_INFO_ITEMS),
+    server="activeTransaction[id, transactionStatus[friendlyName,name]]")
+IMAGE_MASK = "mask[{0}]".format(",".join(IMAGE_INFO_ITEMS))
+# listing images only needs the identifying fields, the full IMAGE_MASK is
+# reserved for detail lookups
+IMAGE_LIST_MASK = "mask[id,name,globalIdentifier]"
+LOCATION_MASK = "mask[{0}]".format(",".join(LOCATION_INFO_ITEMS))
+VLAN_MASK = "mask[id,name,vlanNumber,virtualGuestCount,subnets[networkIdentifier]]"
+
+# matches any character outside string.printable so image names can be
+# sanitized in a single C-level pass
+NON_PRINTABLE = re.compile("[^{0}]".format(re.escape(string.printable)))
+VIRTUAL_MASK = "mask[{0}]".format(",".join(VIRTUAL_INFO_ITEMS))
+
+CLUSTER_NAME_TAG_PREFIX = "storm.cluster.name:"
+_CLUSTER_NAME_TAG_PREFIX_LENGTH = len(CLUSTER_NAME_TAG_PREFIX)
+
 class SoftLayerCluster(object):
     """
     A SoftLayer cluster that containes references to the nodes
@@ -111,10 +142,16 @@ class SoftLayerCluster(object):
         :type timeout: int
         """
         start = datetime.datetime.utcnow()
-        remainingNodes = []
-        for name, node in self.nodes.items():
-            if not self.driver.destroy_node(node):
-                remainingNodes.append(name)
+        # cancel the nodes in parallel since each cancel is a network-bound call
+        with ThreadPoolExecutor(max_workers=min(32, len(self.nodes) or 1)) as pool:
+            results = list(pool.map(
+                lambda item: (item[0], self.driver.destroy_node(item[1])),
+                self.nodes.items()))
+        remainingNodes = [
+            name
+            for name, destroyed in results
+            if not destroyed
+        ]
         if not remainingNodes:
             end = datetime.datetime.utcnow()
             log.info("Destroying cluster '%s' took '%s'", self.name, end-start)
@@ -162,9 +199,80 @@ class SoftLayerNodeDriver(NodeDriver):
     name = "SoftLayerNodeDriver"
     type = "sl"
 
+    # cache of parsed credentials keyed by config file path so repeated
+    # driver construction does not reread the file
+    _configCache = {}
+
     def __init__(self, username, apiKey):
         super(SoftLayerNodeDriver, self).__init__(username, apiKey)
         self.client = SoftLayer.create_client_from_env(username=username, api_key=apiKey)
+        # reuse keep-alive connections across API calls so that back-to-back
+        # requests do not pay for a new TCP+TLS handshake each time
+        session = getattr(getattr(self.client, "transport", None), "session", None)
+        if session is not None:
+            adapter = HTTPAdapter(pool_connections=16,
+                                  pool_maxsize=16,
+                                  max_retries=Retry(total=3, backoff_factor=0.2))
+            session.mount("https://", adapter)
+        self._vs = SoftLayer.VSManager(self.client)
+        self._hardware = SoftLayer.HardwareManager(self.client)
+        self._images = SoftLayer.ImageManager(self.client)
+        self._network = SoftLayer.NetworkManager(self.client)
+        self._createOptionsCache = None
+        self._catalogCache = {}
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exceptionType, exception, traceback):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return False
+
+    @property
+    def _pool(self):
+        """
+        Shared thread pool for overlapping independent API calls, created on
+        first use and reused across calls
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8)
+        return self._executor
+
+    def _cached_catalog(self, key, builder, maxAge=300):
+        """
+        Get a cached catalog entry, rebuilding it via ``builder`` when it is
+        missing or older than ``maxAge`` seconds
+
+        :param key: cache key
+        :type key: str
+        :param builder: callable building the entry on a cache miss
+        :type builder: callable
+        :param maxAge: maximum age of the cached entry in seconds
+        :type maxAge: int
+        :returns: cached entry
+        """
+        entry = self._catalogCache.get(key)
+        if entry is None or time.time() - entry[0] > maxAge:
+            entry = (time.time(), builder())
+            self._catalogCache[key] = entry
+        return entry[1]
+
+    def _create_options(self, maxAge=300):
+        """
+        Get the virtual server creation options, cached for ``maxAge`` seconds
+        so consecutive metadata lookups share one remote call
+
+        :param maxAge: maximum age of the cached options in seconds
+        :type maxAge: int
+        :returns: creation options
+        :rtype: dict
+        """
+        if self._createOptionsCache is None or time.time() - self._createOptionsCache[0] > maxAge:
+            self._createOptionsCache = (time.time(), self._vs.get_create_options())
+        return self._createOptionsCache[1]
 
     def _hardware_to_node(self, instance):
         """
@@ -175,19 +283,18 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: node
         :rtype: :class:`~libcloud.compute.base.Node`
         """
-        publicIps = []
-        if "primaryIpAddress" in instance:
-            publicIps.append(instance["primaryIpAddress"])
-        privateIps = []
-        if "primaryBackendIpAddress" in instance:
-            privateIps.append(instance["primaryBackendIpAddress"])
-
-        disks = []
-        for activeComponent in instance.get("activeComponents", []):
-            hardwareComponentType = activeComponent["hardwareComponentModel"]["hardwareGenericComponentModel"]["hardwareComponentType"]
-            if hardwareComponentType["keyName"] == "HARD_DRIVE":
-                # note that the default unit is GB
-                disks.append(int(activeComponent["hardwareComponentModel"]["capacity"]))
+        publicIp = instance.get("primaryIpAddress")
+        publicIps = [publicIp] if publicIp else []
+        privateIp = instance.get("primaryBackendIpAddress")
+        privateIps = [privateIp] if privateIp else []
+
+        # note that the default unit is GB
+        disks = [
+            int(activeComponent["hardwareComponentModel"]["capacity"])
+            for activeComponent in instance.get("activeComponents", [])
+            if activeComponent["hardwareComponentModel"]["hardwareGenericComponentModel"]
+               ["hardwareComponentType"]["keyName"] == "HARD_DRIVE"
+        ]
 
         sizeExtra = {
             "cpu": int(instance["processorPhysicalCoreAmount"]),
@@ -206,10 +313,8 @@ class SoftLayerNodeDriver(NodeDriver):
             ],
             "type": "bare_metal" if instance["bareMetalInstanceFlag"] == 1 else "virtual_server"
         }
-        try:
-            extra["password"] = instance["operatingSystem"]["passwords"][0]["password"]
-        except:
-            extra["password"] = "unknown"
+        passwords = (instance.get("operatingSystem") or {}).get("passwords") or []
+        extra["password"] = passwords[0].get("password", "unknown") if passwords else "unknown"
 
         # TODO: check power state
         state = NodeState.RUNNING
@@ -234,19 +339,18 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: node
         :rtype: :class:`~libcloud.compute.base.Node`
         """
-        publicIps = []
-        if "primaryIpAddress" in instance:
-            publicIps.append(instance["primaryIpAddress"])
-        privateIps = []
-        if "primaryBackendIpAddress" in instance:
-            privateIps.append(instance["primaryBackendIpAddress"])
-
-        disks = []
-        for blockDevice in instance.get("blockDevices", []):
-            # add all non-swap disks
-            if blockDevice["mountType"] == "Disk" and not blockDevice["diskImage"]["description"].endswith("-SWAP"):
-                # note that the default unit is GB
-                disks.append(int(blockDevice["diskImage"]["capacity"]))
+        publicIp = instance.get("primaryIpAddress")
+        publicIps = [publicIp] if publicIp else []
+        privateIp = instance.get("primaryBackendIpAddress")
+        privateIps = [privateIp] if privateIp else []
+
+        # add all non-swap disks, note that the default unit is GB
+        disks = [
+            int(blockDevice["diskImage"]["capacity"])
+            for blockDevice in instance.get("blockDevices", [])
+            if blockDevice["mountType"] == "Disk"
+            and not blockDevice["diskImage"]["description"].endswith("-SWAP")
+        ]
 
         sizeExtra = {
             "cpu": int(instance["maxCpu"]),
@@ -265,15 +369,11 @@ class SoftLayerNodeDriver(NodeDriver):
             ],
             "type": "virtual_server"
         }
-        if "powerState" in instance and "keyName" in instance["powerState"]:
-            state = self.NODE_STATE_MAP.get(instance["powerState"]["keyName"], NodeState.UNKNOWN)
-        else:
-            state = NodeState.UNKNOWN
+        state = self.NODE_STATE_MAP.get(
+            (instance.get("powerState") or {}).get("keyName"), NodeState.UNKNOWN)
 
-        try:
-            extra["password"] = instance["operatingSystem"]["passwords"][0]["password"]
-        except:
-            extra["password"] = "unknown"
+        passwords = (instance.get("operatingSystem") or {}).get("passwords") or []
+        extra["password"] = passwords[0].get("password", "unknown") if passwords else "unknown"
 
         return Node(
             instance["id"],
@@ -358,8 +458,7 @@ class SoftLayerNodeDriver(NodeDriver):
         :return: True if the destroy was successful, False otherwise.
         :rtype: ``bool``
         """
-        vs = SoftLayer.VSManager(self.client)
-        return vs.cancel_instance(int(node.id))
+        return self._vs.cancel_instance(int(node.id))
 
     def ex_get_available_cpus(self):
         """
@@ -368,8 +467,7 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: list of cpu options
         :rtype: [int]
         """
-        vs = SoftLayer.VSManager(self.client)
-        options = vs.get_create_options()
+        options = self._create_options()
         cpus = set([
             int(item["template"]["startCpus"])
             for item in options["processors"]
@@ -384,8 +482,7 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: disk number to capacity lists mappings
         :rtype: dict
         """
-        vs = SoftLayer.VSManager(self.client)
-        options = vs.get_create_options()
+        options = self._create_options()
         capacities = {}
         for item in options["blockDevices"]:
             blockDevice = item["template"]["blockDevices"][0]
@@ -393,10 +490,11 @@ class SoftLayerNodeDriver(NodeDriver):
             # deal with fact that labeling uses 0 for the first disk
             if number == 0:
                 number = 1
-            if number not in capacities:
-                capacities[number] = set()
-            capacities[number].add(blockDevice["diskImage"]["capacity"])
-        return capacities
+            capacities.setdefault(number, set()).add(blockDevice["diskImage"]["capacity"])
+        return {
+            number: frozenset(values)
+            for number, values in capacities.items()
+        }
 
     def ex_get_available_ram(self):
         """
@@ -405,8 +503,7 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: list of ram/memory options
         :rtype: [int]
         """
-        vs = SoftLayer.VSManager(self.client)
-        options = vs.get_create_options()
+        options = self._create_options()
         return sorted([
             int(item["template"]["maxMemory"])
             for item in options["memory"]
@@ -414,13 +511,24 @@ class SoftLayerNodeDriver(NodeDriver):
 
     def ex_get_available_operating_systems(self):
         """
-        Get information on the available operating systems
+        Get information on the available operating systems, cached for a few
+        minutes since the catalog changes rarely (see
+        :meth:`~SoftLayerNodeDriver.ex_refresh_catalog`)
 
         :returns: operating system code to name mapping
         :rtype: dict
         """
-        vs = SoftLayer.VSManager(self.client)
-        options = vs.get_create_options()
+        return self._cached_catalog("operatingSystems",
+                                    self._fetch_operating_systems)
+
+    def _fetch_operating_systems(self):
+        """
+        Extract the operating system mapping from the create options
+
+        :returns: operating system code to name mapping
+        :rtype: dict
+        """
+        options = self._create_options()
         return {
             item["template"]["operatingSystemReferenceCode"]: item["itemPrice"]["item"]["description"]
             for item in options["operatingSystems"]
@@ -435,10 +543,12 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: cluster
         :rtype: :class:`~SoftLayerCluster`
         """
-        nameTag = "storm.cluster.name:{0}".format(name)
-        nodes = []
-        nodes.extend(self.ex_get_hardware_nodes(tags=[nameTag]))
-        nodes.extend(self.ex_get_virtual_nodes(tags=[nameTag]))
+        nameTag = CLUSTER_NAME_TAG_PREFIX + name
+        # the hardware and virtual listings are independent calls, so overlap
+        # their round-trips
+        hardwareNodes = self._pool.submit(self.ex_get_hardware_nodes, tags=[nameTag])
+        virtualNodes = self._pool.submit(self.ex_get_virtual_nodes, tags=[nameTag])
+        nodes = hardwareNodes.result() + virtualNodes.result()
         if nodes:
             cluster = SoftLayerCluster(name, self)
             cluster.nodes = {
@@ -519,29 +629,28 @@ class SoftLayerNodeDriver(NodeDriver):
             createOptions["disks"] = size.diskCapacities
             createOptions["local_disk"] = len(size.diskCapacities) <= 2  # if there are >2 disks, then choose SAN
 
-        publicVlans = self.ex_get_vlans(includePrivate=False, includePublic=True, datacenter=location.id)
+        privateVlans, publicVlans = self._list_vlans_split(datacenter=location.id)
         if publicVlans:
-            # sort by the vlans with the largest number of guests
-            publicVlans = sorted(publicVlans, key=lambda vlan: vlan.get("virtualGuestCount", 0))
-            largestPublicVlan = publicVlans.pop()
+            # pick the vlan with the largest number of guests
+            largestPublicVlan = max(publicVlans, key=lambda vlan: vlan.get("virtualGuestCount", 0))
             log.info("Using public vlan '%s' with currently '%d' guests",
                      largestPublicVlan["id"], largestPublicVlan.get("virtualGuestCount", 0))
             createOptions["public_vlan"] = largestPublicVlan["id"]
-        privateVlans = self.ex_get_vlans(includePrivate=True, includePublic=False, datacenter=location.id)
         if privateVlans:
-            # sort by the vlans with the largest number of guests
-            privateVlans = sorted(privateVlans, key=lambda vlan: vlan.get("virtualGuestCount", 0))
-            largestPrivateVlan = privateVlans.pop()
+            # pick the vlan with the largest number of guests
+            largestPrivateVlan = max(privateVlans, key=lambda vlan: vlan.get("virtualGuestCount", 0))
             log.info("Using private vlan '%s' with currently '%d' guests",
                      largestPrivateVlan["id"], largestPrivateVlan.get("virtualGuestCount", 0))
             createOptions["private_vlan"] = largestPrivateVlan["id"]
 
-        configurations = []
-        for name in names:
-            nodeConfig = createOptions.copy()
-            nodeConfig["hostname"] = "{cluster}-{name}".format(cluster=cluster, name=name)
-            nodeConfig["tags"] = "storm.cluster,storm.cluster.name:{cluster}".format(cluster=cluster)
-            configurations.append(nodeConfig)
+        clusterTags = "storm.cluster,{prefix}{cluster}".format(
+            prefix=CLUSTER_NAME_TAG_PREFIX, cluster=cluster)
+        configurations = [
+            dict(createOptions,
+                 hostname="{cluster}-{name}".format(cluster=cluster, name=name),
+                 tags=clusterTags)
+            for name in names
+        ]
 
         nodes = self.ex_create_nodes(configurations, timeout=timeout)
         if nodes:
@@ -566,8 +675,10 @@ class SoftLayerNodeDriver(NodeDriver):
         :param timeout: timeout in seconds for the nodes to be provisioned
         :type timeout: int
         """
+        if not configs:
+            return []
         totalStart = datetime.datetime.utcnow()
-        vs = SoftLayer.VSManager(self.client)
+        vs = self._vs
 
         # extract tags
         tags = [
@@ -575,63 +686,140 @@ class SoftLayerNodeDriver(NodeDriver):
             for config in configs
         ]
 
-        objects = []
-        for config in configs:
+        def generateTemplate(config):
             template = vs._generate_create_dict(**config)
             if "image_id" in config:
                 # work around for 'Invalid value provided for 'blockDevices'. Block devices may not be provided when using an image template.' issue
                 # see https://github.com/softlayer/softlayer-python/issues/325
                 template.pop("blockDevices", None)
                 template["imageTemplateId"] = config["image_id"]
-            objects.append(template)
+            return template
+
+        # cluster creation produces configurations that differ only in their
+        # hostname, so in that case generate the heavy creation template once
+        # and clone it per node instead of regenerating it
+        reference = {
+            key: value
+            for key, value in configs[0].items()
+            if key != "hostname"
+        }
+        sharedConfigs = all(
+            {key: value for key, value in config.items() if key != "hostname"} == reference
+            for config in configs[1:]
+        )
+        if sharedConfigs:
+            baseTemplate = generateTemplate(configs[0])
+            objects = [
+                dict(baseTemplate, hostname=config["hostname"])
+                for config in configs
+            ]
+        else:
+            objects = [
+                generateTemplate(config)
+                for config in configs
+            ]
 
         instanceInfos = vs.guest.createObjects(objects)
 
-        # set tags on the created instances
-        for instance, tag in zip(instanceInfos, tags):
-            if tag:
-                vs.guest.setTags(tag, id=instance["id"])
+        taggedInstances = [
+            (instance, tag)
+            for instance, tag in zip(instanceInfos, tags)
+            if tag
+        ]
 
         nodes = []
         transactions = {}
-        readyInstances = set()
-        while timeout > 0:
+        readyIds = set()
+        # resolve the display names once so the polling loop can key its
+        # bookkeeping by cheap integer ids instead of long domain strings
+        fqdns = {
+            instanceInfo["id"]: instanceInfo["fullyQualifiedDomainName"]
+            for instanceInfo in instanceInfos
+        }
 
-            # go through all the nodes and check their current transactions
-            for instanceInfo in instanceInfos:
+        # set tags on the created instances in parallel since each setTags
+        # call is a separate RPC
+        if taggedInstances:
+            with ThreadPoolExecutor(max_workers=min(16, len(taggedInstances))) as pool:
+                list(pool.map(
+                    lambda item: vs.guest.setTags(item[1], id=item[0]["id"]),
+                    taggedInstances))
+
+        # only ask for the fields needed to decide readiness while polling
+        pollMask = "mask[id,provisionDate,activeTransaction[id,transactionStatus[friendlyName]]]"
+        # provisioning takes minutes, so poll with exponential backoff instead
+        # of a fixed one second interval to keep the request count down
+        deadline = time.time() + timeout
+        delay = 2
+        while time.time() < deadline:
+
+            # poll all pending nodes with a single filtered account call
+            # instead of one round-trip per instance
+            pendingIds = [
+                instanceId
+                for instanceId in fqdns
+                if instanceId not in readyIds
+            ]
+            objectFilter = {
+                "virtualGuests": {
+                    "id": {
+                        "operation": "in",
+                        "options": [{"name": "data", "value": pendingIds}]
+                    }
+                }
+            }
+            instances = self.client["Account"].getVirtualGuests(
+                mask=pollMask, filter=objectFilter)
 
-                if instanceInfo["fullyQualifiedDomainName"] not in readyInstances:
+            # go through all the nodes and check their current transactions
+            for instance in instances:
 
-                    instance = vs.get_instance(instanceInfo["id"])
-                    activeTransactionId = SoftLayer.utils.lookup(instance, "activeTransaction", "id")
-                    activeTransactionName = SoftLayer.utils.lookup(instance, "activeTransaction", "transactionStatus", "friendlyName")
+                activeTransactionId = SoftLayer.utils.lookup(instance, "activeTransaction", "id")
+                activeTransactionName = SoftLayer.utils.lookup(instance, "activeTransaction", "transactionStatus", "friendlyName")
 
-                    # log if the transaction has changed
-                    if (activeTransactionName is not None
-                            and activeTransactionName != transactions.get(instanceInfo["fullyQualifiedDomainName"], None)):
-                        log.info("%s: %s", instanceInfo["fullyQualifiedDomainName"], activeTransactionName)
-                        transactions[instanceInfo["fullyQualifiedDomainName"]] = activeTransactionName
+                # log if the transaction has changed
+                instanceId = instance["id"]
+                if (activeTransactionName is not None
+                        and activeTransactionName != transactions.get(instanceId, None)):
+                    log.info("%s: %s", fqdns[instanceId], activeTransactionName)
+                    transactions[instanceId] = activeTransactionName
 
-                    # check that the instance has finished provisioning
-                    if all([instance.get('provisionDate'),
-                            not activeTransactionId]):
-                        readyInstances.add(instance["fullyQualifiedDomainName"])
+                # check that the instance has finished provisioning
+                if all([instance.get('provisionDate'),
+                        not activeTransactionId]):
+                    readyIds.add(instanceId)
 
-            if len(readyInstances) == len(instanceInfos):
+            if len(readyIds) == len(instanceInfos):
                 break
             else:
-                timeout -= 1
-                time.sleep(1)
+                time.sleep(min(delay, max(deadline - time.time(), 0)))
+                delay = min(delay * 1.5, 30)
 
-        if len(readyInstances) != len(instanceInfos):
+        if len(readyIds) != len(instanceInfos):
             log.info("Creating %d nodes timed out", len(instanceInfos))
             return nodes
 
-        for instanceInfo in instanceInfos:
-            # make sure we include masks for information we need
-            virtualkwargs = {"mask" : "mask[{0}]".format(",".join(VIRTUAL_INFO_ITEMS))}
-            instance = vs.get_instance(instanceInfo['id'], **virtualkwargs)
-            nodes.append(self._virtual_to_node(instance))
+        # fetch the full information for all created instances in one call
+        # instead of one round-trip per instance, making sure we include
+        # masks for information we need
+        instanceIds = [instanceInfo["id"] for instanceInfo in instanceInfos]
+        objectFilter = {
+            "virtualGuests": {
+                "id": {
+                    "operation": "in",
+                    "options": [{"name": "data", "value": instanceIds}]
+                }
+            }
+        }
+        instances = self.client["Account"].getVirtualGuests(
+            mask=VIRTUAL_MASK,
+            filter=objectFilter)
+        instancesById = {
+            instance["id"]: instance
+            for instance in instances
+        }
+        for instanceId in instanceIds:
+            nodes.append(self._virtual_to_node(instancesById[instanceId]))
 
         totalEnd = datetime.datetime.utcnow()
         log.info("Creating %d nodes took %s", len(instanceInfos), totalEnd-totalStart)
@@ -646,12 +834,18 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: SoftLayer node driver
         :rtype: :class:`~SoftLayerNodeDriver`
         """
-        config = ConfigParser.ConfigParser()
-        config.read(os.path.expanduser(configFileName))
-        return SoftLayerNodeDriver(
-            config.get("softlayer", "username"),
-            config.get("softlayer", "api_key")
-        )
+        configFilePath = os.path.expanduser(configFileName)
+        if configFilePath not in SoftLayerNodeDriver._configCache:
+            if not os.path.exists(configFilePath):
+                raise ValueError("Config file '{0}' does not exist".format(configFileName))
+            config = configparser.ConfigParser()
+            config.read(configFilePath)
+            SoftLayerNodeDriver._configCache[configFilePath] = (
+                config.get("softlayer", "username"),
+                config.get("softlayer", "api_key")
+            )
+        username, apiKey = SoftLayerNodeDriver._configCache[configFilePath]
+        return SoftLayerNodeDriver(username, apiKey)
 
     def ex_get_hardware_nodes(self, **kwargs):
         """
@@ -659,7 +853,7 @@ class SoftLayerNodeDriver(NodeDriver):
 
         :param boolean hourly: include hourly instances
         :param boolean monthly: include monthly instances
-        :param list tags: filter based on list of tags
+        :param list tags: filter based on list of tags (applied server-side)
         :param integer cpus: filter based on number of CPUS
         :param integer memory: filter based on amount of memory
         :param string hostname: filter based on hostname
@@ -672,20 +866,71 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: list of nodes
         :rtype: [:class:`~libcloud.compute.base.Node`]
         """
-        nodes = []
-        # make sure we include masks for information we need
-        serverItems = [
-            'activeTransaction[id, transactionStatus[friendlyName,name]]',
-        ]
-        kwargs["mask"] = "[mask[{info}],mask(SoftLayer_Hardware_Server)[{server}]]".format(
-            info=",".join(HARDWARE_INFO_ITEMS),
-            server=",".join(serverItems))
-        hardwareManager = SoftLayer.HardwareManager(self.client)
-        for hardware in hardwareManager.list_hardware(**kwargs):
-            nodes.append(self._hardware_to_node(hardware))
-        nodes = sorted(nodes, key=lambda node: node.name)
+        nodes = list(self.ex_iter_hardware_nodes(**kwargs))
+        nodes.sort(key=attrgetter("name"))
         return nodes
 
+    def ex_iter_hardware_nodes(self, **kwargs):
+        """
+        Iterate over hardware nodes (server and bare metal) page by page so
+        only one page is held in memory at a time, optionally filtered by the
+        same keyword arguments as
+        :meth:`~SoftLayerNodeDriver.ex_get_hardware_nodes`
+
+        :returns: node generator
+        :rtype: generator of :class:`~libcloud.compute.base.Node`
+        """
+        # make sure we include masks for information we need; leave the page
+        # size at the SDK default since older SoftLayer releases treat an
+        # explicit limit as a total-result cap rather than a page size
+        kwargs["mask"] = HARDWARE_MASK
+        kwargs.setdefault("iter", True)
+        for hardware in self._hardware.list_hardware(**kwargs):
+            yield self._hardware_to_node(hardware)
+
+    def _image_index(self):
+        """
+        Get a name to image mapping, cached so repeated lookups do not
+        refetch the image catalog
+
+        :returns: name to image mapping
+        :rtype: dict
+        """
+        def build():
+            # image names are not unique, so keep the first occurrence to
+            # match the order a linear scan over list_images would find
+            index = {}
+            for image in self.list_images():
+                index.setdefault(image.name, image)
+            return index
+        return self._cached_catalog("imageIndex", build)
+
+    def _image_id_index(self):
+        """
+        Get an id to image mapping, cached so repeated lookups do not
+        refetch the image catalog
+
+        :returns: id to image mapping
+        :rtype: dict
+        """
+        return self._cached_catalog("imageIdIndex", lambda: {
+            image.id: image
+            for image in self.list_images()
+        })
+
+    def _location_index(self):
+        """
+        Get a name to location mapping, cached so repeated lookups do not
+        refetch the datacenter catalog
+
+        :returns: name to location mapping
+        :rtype: dict
+        """
+        return self._cached_catalog("locationIndex", lambda: {
+            location.name: location
+            for location in self.list_locations()
+        })
+
     def ex_get_image_by_name(self, name):
         """
         Get a image by name
@@ -694,10 +939,22 @@ class SoftLayerNodeDriver(NodeDriver):
         :type name: str
         :returns: :class:`~libcloud.compute.base.NodeImage`
         """
-        for image in self.list_images():
-            if image.name == name:
-                return image
-        return None
+        return self._image_index().get(name)
+
+    def ex_get_image_details(self, imageId):
+        """
+        Get detailed information for the specified image, including its
+        block devices, cached for a few minutes per image (see
+        :meth:`~SoftLayerNodeDriver.ex_refresh_catalog`)
+
+        :param imageId: image id
+        :type imageId: int
+        :returns: image information dictionary
+        :rtype: dict
+        """
+        return self._cached_catalog(
+            "imageDetails:{0}".format(imageId),
+            lambda: self._images.get_image(imageId, mask=IMAGE_MASK))
 
     def ex_get_location_by_name(self, name):
         """
@@ -707,10 +964,15 @@ class SoftLayerNodeDriver(NodeDriver):
         :type name: str
         :returns: :class:`~libcloud.compute.base.NodeLocation`
         """
-        for location in self.list_locations():
-            if location.name == name:
-                return location
-        return None
+        return self._location_index().get(name)
+
+    def ex_refresh_catalog(self):
+        """
+        Invalidate the cached image, location and size catalog information so
+        the next lookup fetches fresh data
+        """
+        self._catalogCache.clear()
+        self._createOptionsCache = None
 
     def ex_get_size_by_attributes(self, cpus, ram, disks):
         """
@@ -738,13 +1000,18 @@ class SoftLayerNodeDriver(NodeDriver):
                       ",".join(str(ram) for ram in availableRam))
             return None
         availableCapacities = self.ex_get_available_disk_capacities()
-        for number, diskCapacity in enumerate(disks, 1):
-            if diskCapacity not in availableCapacities[number]:
-                log.error("'%d' size of disk is not supported for disk number '%d' (available '%s')",
-                          diskCapacity,
-                          number,
-                          ",".join(str(capacity) for capacity in availableCapacities[number]))
-                return None
+        unsupported = next(
+            ((number, diskCapacity)
+             for number, diskCapacity in enumerate(disks, 1)
+             if diskCapacity not in availableCapacities.get(number, frozenset())),
+            None)
+        if unsupported:
+            number, diskCapacity = unsupported
+            log.error("'%d' size of disk is not supported for disk number '%d' (available '%s')",
+                      diskCapacity,
+                      number,
+                      ",".join(str(capacity) for capacity in availableCapacities.get(number, frozenset())))
+            return None
         return SoftLayerNodeSize(self, extra={
             "cpu": cpus,
             "disks" : disks,
@@ -758,7 +1025,7 @@ class SoftLayerNodeDriver(NodeDriver):
 
         :param boolean hourly: include hourly instances
         :param boolean monthly: include monthly instances
-        :param list tags: filter based on list of tags
+        :param list tags: filter based on list of tags (applied server-side)
         :param integer cpus: filter based on number of CPUS
         :param integer memory: filter based on amount of memory
         :param string hostname: filter based on hostname
@@ -771,15 +1038,27 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: list of nodes
         :rtype: [:class:`~libcloud.compute.base.Node`]
         """
-        nodes = []
-        vs = SoftLayer.VSManager(self.client)
-        # make sure we include masks for information we need
-        kwargs["mask"] = "mask[{0}]".format(",".join(VIRTUAL_INFO_ITEMS))
-        for instance in vs.list_instances(**kwargs):
-            nodes.append(self._virtual_to_node(instance))
-        nodes = sorted(nodes, key=lambda node: node.name)
+        nodes = list(self.ex_iter_virtual_nodes(**kwargs))
+        nodes.sort(key=attrgetter("name"))
         return nodes
 
+    def ex_iter_virtual_nodes(self, **kwargs):
+        """
+        Iterate over virtual nodes page by page so only one page is held in
+        memory at a time, optionally filtered by the same keyword arguments
+        as :meth:`~SoftLayerNodeDriver.ex_get_virtual_nodes`
+
+        :returns: node generator
+        :rtype: generator of :class:`~libcloud.compute.base.Node`
+        """
+        # make sure we include masks for information we need; leave the page
+        # size at the SDK default since older SoftLayer releases treat an
+        # explicit limit as a total-result cap rather than a page size
+        kwargs["mask"] = VIRTUAL_MASK
+        kwargs.setdefault("iter", True)
+        for instance in self._vs.list_instances(**kwargs):
+            yield self._virtual_to_node(instance)
+
     def ex_get_vlans(self, includePrivate=True, includePublic=True, datacenter=None):
         """
         Get a list of vlans
@@ -795,25 +1074,52 @@ class SoftLayerNodeDriver(NodeDriver):
         """
         if not includePrivate and not includePublic:
             return []
-        networkManager = SoftLayer.NetworkManager(self.client)
+        privateVlans, publicVlans = self._list_vlans_split(
+            datacenter=datacenter,
+            includePrivate=includePrivate,
+            includePublic=includePublic)
+        return privateVlans + publicVlans
+
+    def ex_get_vlans_bulk(self, datacenter=None):
+        """
+        Get the private, public and combined vlan listings from a single
+        call, for callers that need several views of the same vlans
 
-        vlans = networkManager.list_vlans(datacenter=datacenter)
+        :param datacenter: datacenter
+        :type datacenter: str
+        :returns: private, public and combined vlan information dictionaries
+        :rtype: ([dict], [dict], [dict])
+        """
+        privateVlans, publicVlans = self._list_vlans_split(datacenter=datacenter)
+        return privateVlans, publicVlans, privateVlans + publicVlans
+
+    def _list_vlans_split(self, datacenter=None, includePrivate=True, includePublic=True):
+        """
+        Get the vlans split into private and public ones using a single
+        listing call, skipping accumulation of a bucket the caller does
+        not want
+
+        :param datacenter: datacenter
+        :type datacenter: str
+        :param includePrivate: accumulate private vlans
+        :type includePrivate: bool
+        :param includePublic: accumulate public vlans
+        :type includePublic: bool
+        :returns: private and public vlan information dictionaries
+        :rtype: ([dict], [dict])
+        """
         privateVlans = []
         publicVlans = []
-        for vlan in vlans:
-            subnetIdentifiers = [subnet["networkIdentifier"]
-                                 for subnet in vlan.get("subnets", [])]
-            if all([identifier.startswith("10.") for identifier in subnetIdentifiers]):
-                privateVlans.append(vlan)
-            else:
+        # only request the fields needed for classification and vlan selection
+        # so the server returns less data
+        for vlan in self._network.list_vlans(datacenter=datacenter, mask=VLAN_MASK):
+            if all(subnet["networkIdentifier"].startswith("10.")
+                   for subnet in vlan.get("subnets", [])):
+                if includePrivate:
+                    privateVlans.append(vlan)
+            elif includePublic:
                 publicVlans.append(vlan)
-
-        if includePrivate and not includePublic:
-            return privateVlans
-        elif includePublic and not includePrivate:
-            return publicVlans
-        else:
-            return vlans
+        return privateVlans, publicVlans
 
     def ex_list_clusters(self):
         """
@@ -822,15 +1128,18 @@ class SoftLayerNodeDriver(NodeDriver):
         :returns: [:class:`~SoftLayerCluster`]
         """
         clusterMap = {}
-        nodes = []
-        nodes.extend(self.ex_get_hardware_nodes(tags=["storm.cluster"]))
-        nodes.extend(self.ex_get_virtual_nodes(tags=["storm.cluster"]))
+        # the hardware and virtual listings are independent calls, so overlap
+        # their round-trips
+        hardwareNodes = self._pool.submit(self.ex_get_hardware_nodes, tags=["storm.cluster"])
+        virtualNodes = self._pool.submit(self.ex_get_virtual_nodes, tags=["storm.cluster"])
+        nodes = hardwareNodes.result() + virtualNodes.result()
         for node in nodes:
             clusterName = get_cluster_name(node.extra["tags"])
-            if clusterName not in clusterMap:
-                clusterMap[clusterName] = SoftLayerCluster(clusterName, self)
-            clusterMap[clusterName].nodes[node.name] = node
-        clusters = sorted(clusterMap.values(), key=lambda cluster: cluster.name)
+            cluster = clusterMap.get(clusterName)
+            if cluster is None:
+                cluster = clusterMap[clusterName] = SoftLayerCluster(clusterName, self)
+            cluster.nodes[node.name] = node
+        clusters = sorted(clusterMap.values(), key=attrgetter("name"))
         return clusters
 
     def get_image(self, image_id):
@@ -843,98 +1152,169 @@ class SoftLayerNodeDriver(NodeDriver):
         :rtype :class:`.NodeImage`:
         :return: NodeImage instance on success.
         """
-        for image in self.list_images():
-            if image.id == image_id:
-                return image
-        return None
+        return self._image_id_index().get(image_id)
 
     def list_images(self, location=None):
         """
-        Get a list of images
+        Get a list of images, cached for a few minutes since the image
+        catalog changes rarely (see
+        :meth:`~SoftLayerNodeDriver.ex_refresh_catalog`)
 
         :param location: location
         :type location: :class:`~libcloud.compute.base.NodeLocation`
         :returns: [:class:`~libcloud.compute.base.NodeImage`]
         """
+        return self._cached_catalog("images:{0}".format(location),
+                                    lambda: self._fetch_images(location))
+
+    def _fetch_images(self, location=None):
+        """
+        Fetch the list of images from the API
+
+        :param location: location
+        :type location: :class:`~libcloud.compute.base.NodeLocation`
+        :returns: [:class:`~libcloud.compute.base.NodeImage`]
+        """
+        return list(self.ex_iter_images(location))
+
+    def ex_iter_images(self, location=None):
+        """
+        Iterate over images one at a time so callers looking for a specific
+        image can stop without materializing the whole catalog
+
+        :param location: location
+        :type location: :class:`~libcloud.compute.base.NodeLocation`
+        :returns: image generator
+        :rtype: generator of :class:`~libcloud.compute.base.NodeImage`
+        """
         # TODO: incorporate location
         # include operating system images
-        images = [
-            SoftLayerOperatingSystemImage(osCode, osName, self)
-            for osCode, osName in self.ex_get_available_operating_systems().items()
-        ]
-        # include private and public images
-        imageManager = SoftLayer.ImageManager(self.client)
-
-        # make sure we include masks for information we need
-        kwargs = {"mask": "mask[{0}]".format(",".join(IMAGE_INFO_ITEMS))}
-        softlayerImages = imageManager.list_private_images(**kwargs)
-        softlayerImages.extend(imageManager.list_public_images(**kwargs))
-        softlayerImages = sorted(softlayerImages, key=lambda image: image["name"])
-        for image in softlayerImages:
+        for osCode, osName in self.ex_get_available_operating_systems().items():
+            yield SoftLayerOperatingSystemImage(osCode, osName, self)
+        # include private and public images, only asking for the identifying
+        # fields so each image row stays small; the private listing and the
+        # page-by-page public catalog fetch are independent calls, so overlap
+        # their round-trips and merge the two sorted streams instead of
+        # re-sorting the concatenation
+        privateFuture = self._pool.submit(
+            self._images.list_private_images, mask=IMAGE_LIST_MASK)
+        publicImages = sorted(self._iter_public_images(), key=itemgetter("name"))
+        privateImages = sorted(privateFuture.result(), key=itemgetter("name"))
+        for image in heapq.merge(privateImages, publicImages, key=itemgetter("name")):
             extra = {
                 "id": image["id"]
             }
-            printableCharacters = [
-                char
-                for char in image["name"]
-                if char in string.printable
-            ]
-            sanitizedName = "".join(printableCharacters).strip()
-            images.append(
-                NodeImage(image["globalIdentifier"],
-                          sanitizedName,
-                          self,
-                          extra)
-            )
-        return images
+            sanitizedName = NON_PRINTABLE.sub("", image["name"]).strip()
+            yield NodeImage(image["globalIdentifier"],
+                            sanitizedName,
+                            self,
+                            extra)
+
+    def _iter_public_images(self, pageSize=500):
+        """
+        Iterate over the public image catalog page by page so only one page
+        is held in memory at a time
+
+        :param pageSize: number of images per page
+        :type pageSize: int
+        :returns: image information dictionary generator
+        :rtype: generator of dict
+        """
+        offset = 0
+        while True:
+            page = self.client["Virtual_Guest_Block_Device_Template_Group"].getPublicImages(
+                mask=IMAGE_LIST_MASK, limit=pageSize, offset=offset)
+            for image in page:
+                yield image
+            if len(page) < pageSize:
+                break
+            offset += pageSize
 
     def list_locations(self):
         """
-        List data centers for a provider
+        List data centers for a provider, cached for a few minutes since
+        datacenter metadata essentially never changes (see
+        :meth:`~SoftLayerNodeDriver.ex_refresh_catalog`)
+
+        :return: list of node location objects
+        :rtype: ``list`` of :class:`.NodeLocation`
+        """
+        return self._cached_catalog("locations", self._fetch_locations)
+
+    def _fetch_locations(self):
+        """
+        Fetch the list of datacenter locations from the API
 
         :return: list of node location objects
         :rtype: ``list`` of :class:`.NodeLocation`
         """
-        locations = []
-        mask = {"mask" : "mask[{0}]".format(",".join(LOCATION_INFO_ITEMS))}
-        datacenters = self.client["Location"].getDatacenters(**mask)
+        return list(self.ex_iter_locations())
+
+    def ex_iter_locations(self):
+        """
+        Iterate over datacenter locations one at a time
+
+        :returns: location generator
+        :rtype: generator of :class:`.NodeLocation`
+        """
+        datacenters = self.client["Location"].getDatacenters(mask=LOCATION_MASK)
         for datacenter in datacenters:
             extra = {
                 "id": datacenter["id"]
             }
-            country = ""
-            if "locationAddress" in datacenter and isinstance(datacenter["locationAddress"], dict):
-                address = datacenter["locationAddress"]
-                country = address["country"]
-                extra["address"] = address["address1"]
-                if "address2" in address:
-                    extra["address"] += ", {0}".format(address["address2"])
-                extra["city"] = address["city"]
-                extra["description"] = address["description"]
-            locations.append(
-                SoftLayerNodeLocation(datacenter["name"],
-                                      datacenter["longName"],
-                                      country,
-                                      self,
-                                      extra=extra)
-            )
-        return locations
+            address = datacenter.get("locationAddress") or {}
+            country = address.get("country", "")
+            if address:
+                extra["address"] = ", ".join(
+                    filter(None, (address.get("address1"), address.get("address2"))))
+                extra["city"] = address.get("city")
+                extra["description"] = address.get("description")
+            yield SoftLayerNodeLocation(datacenter["name"],
+                                        datacenter["longName"],
+                                        country,
+                                        self,
+                                        extra=extra)
+
+    def list_nodes(self, kinds=("hardware", "virtual")):
+        """
+        Get a list of nodes, optionally restricted to only hardware or only
+        virtual ones so single-kind callers skip an account-wide query
+
+        :param kinds: node kinds to include, any of ``hardware`` and ``virtual``
+        :type kinds: tuple
+        :returns: [:class:`~libcloud.compute.base.Node`]
+        """
+        if "hardware" not in kinds:
+            return self.ex_get_virtual_nodes() if "virtual" in kinds else []
+        if "virtual" not in kinds:
+            return self.ex_get_hardware_nodes()
+        # the hardware and virtual listings are independent calls, so overlap
+        # their round-trips; both come back name-sorted already, so merging
+        # the two streams avoids re-sorting the concatenation
+        hardwareNodes = self._pool.submit(self.ex_get_hardware_nodes)
+        virtualNodes = self._pool.submit(self.ex_get_virtual_nodes)
+        return list(heapq.merge(hardwareNodes.result(), virtualNodes.result(),
+                                key=attrgetter("name")))
 
-    def list_nodes(self):
+    def ex_iter_nodes(self, **kwargs):
         """
-        Get a list of nodes
+        Iterate over hardware and virtual nodes page by page so only one
+        page is held in memory at a time, optionally filtered by the same
+        keyword arguments as :meth:`~SoftLayerNodeDriver.ex_get_hardware_nodes`
 
-        :returns: [:class:`~libcloud.compute.base.Node`]
+        :returns: node generator
+        :rtype: generator of :class:`~libcloud.compute.base.Node`
         """
-        nodes = []
-        nodes.extend(self.ex_get_hardware_nodes())
-        nodes.extend(self.ex_get_virtual_nodes())
-        nodes = sorted(nodes, key=lambda node: node.name)
-        return nodes
+        for node in self.ex_iter_hardware_nodes(**dict(kwargs)):
+            yield node
+        for node in self.ex_iter_virtual_nodes(**dict(kwargs)):
+            yield node
 
     def list_sizes(self, location=None):
         """
-        List sizes on a provider
+        List sizes on a provider, cached for a few minutes since the size
+        options change rarely (see
+        :meth:`~SoftLayerNodeDriver.ex_refresh_catalog`)
 
         :param location: The location at which to list sizes
         :type location: :class:`.NodeLocation`
@@ -942,47 +1322,63 @@ class SoftLayerNodeDriver(NodeDriver):
         :return: list of node size objects
         :rtype: ``list`` of :class:`.NodeSize`
         """
-        sizes = [
-            SoftLayerNodeSize(None, extra={
-                "cpu": DEFAULT_CPU_SIZE,
-                "disks" : [100],
-                "memory": DEFAULT_RAM_SIZE/1024,
-                "type": "virtual_server"
-            })
-        ]
-        vs = SoftLayer.VSManager(self.client)
-        # add different component sizes
-        virtualMachineOptions = vs.get_create_options()
+        return self._cached_catalog("sizes:{0}".format(location),
+                                    lambda: self._fetch_sizes(location))
+
+    def _fetch_sizes(self, location=None):
+        """
+        Fetch the list of sizes from the API
+
+        :param location: The location at which to list sizes
+        :type location: :class:`.NodeLocation`
+
+        :return: list of node size objects
+        :rtype: ``list`` of :class:`.NodeSize`
+        """
+        return list(self.ex_iter_sizes(location))
+
+    def ex_iter_sizes(self, location=None):
+        """
+        Iterate over sizes one at a time so callers scanning for a specific
+        combination can stop without materializing the whole matrix
+
+        :param location: The location at which to list sizes
+        :type location: :class:`.NodeLocation`
+
+        :returns: size generator
+        :rtype: generator of :class:`.NodeSize`
+        """
+        # add different component sizes, reusing the TTL-cached create
+        # options shared with the ex_get_available_* helpers
+        virtualMachineOptions = self._create_options()
 
         # TODO: determine need to support dedicatedAccountHostOnlyFlag
-        cpus = set([
+        cpus = sorted({
             int(item["template"]["startCpus"])
             for item in virtualMachineOptions["processors"]
-        ])
-        sizes = get_additional_sizes(
-            "cpu",
-            sorted(cpus),
-            sizes
-        )
+        })
         memory = [
             int(item["template"]["maxMemory"])
             for item in virtualMachineOptions["memory"]
         ]
-        sizes = get_additional_sizes(
-            "memory",
-            memory,
-            sizes
-        )
 
-        # adjust driver properties
-        for size in sizes:
-            size.driver = self
-        return sizes
+        # build the full cpu x memory cross product in a single pass instead
+        # of expanding one component at a time through intermediate lists
+        base = {
+            "disks": [100],
+            "type": "virtual_server"
+        }
+        for cpu, ram in itertools.product(cpus, memory):
+            yield SoftLayerNodeSize(self, extra=dict(base, cpu=cpu, memory=ram))
 
 class SoftLayerNodeSize(NodeSize):
     """
     A node image size information
 
+    The derived ``disk``, ``id`` and ``name`` values are computed from the
+    extra properties on first access and then cached on the instance, since
+    the extra properties do not change after construction
+
     :param driver: driver
     :type driver: :class:`~libcloud.compute.base.NodeDriver`
     :param extra: optional provider specific attributes
@@ -1022,7 +1418,10 @@ class SoftLayerNodeSize(NodeSize):
         """
         Amount of disk storage in GB
         """
-        return sum(self.diskCapacities)
+        cached = self.__dict__.get("_disk")
+        if cached is None:
+            cached = self.__dict__["_disk"] = sum(self.diskCapacities)
+        return cached
 
     @disk.setter
     def disk(self, value):
@@ -1034,11 +1433,12 @@ class SoftLayerNodeSize(NodeSize):
         """
         Disk type
         """
-        if "localDiskFlag" in self.extra:
-            local = self.extra["localDiskFlag"]
-        else:
-            local = len(self.diskCapacities) <= 2
-        return "LOCAL" if local else "SAN"
+        cached = self.__dict__.get("_diskType")
+        if cached is None:
+            local = self.extra.get("localDiskFlag",
+                                   len(self.diskCapacities) <= 2)
+            cached = self.__dict__["_diskType"] = "LOCAL" if local else "SAN"
+        return cached
 
     @property
     def diskCapacities(self):
@@ -1052,11 +1452,14 @@ class SoftLayerNodeSize(NodeSize):
         """
         Unique id
         """
-        return "{cpu}-cpu-{ram}-ram-{diskCapacities}-disks".format(
-            cpu=self.cpu,
-            ram=self.ram,
-            diskCapacities=self.diskCapacities
-        )
+        cached = self.__dict__.get("_id")
+        if cached is None:
+            cached = self.__dict__["_id"] = "{cpu}-cpu-{ram}-ram-{diskCapacities}-disks".format(
+                cpu=self.cpu,
+                ram=self.ram,
+                diskCapacities=self.diskCapacities
+            )
+        return cached
 
     @id.setter
     def id(self, value):
@@ -1068,14 +1471,14 @@ class SoftLayerNodeSize(NodeSize):
         """
         Human readable name
         """
-        return "{cpu}xCPU, {ram}GB, {disks} {diskType} disks ({diskCapacities}), {bandwidth}Mbps".format(
-            cpu=self.cpu,
-            ram=self.ram/1024,
-            disks=len(self.diskCapacities),
-            diskType=self.diskType,
-            diskCapacities=",".join(str(capacity) for capacity in self.diskCapacities),
-            bandwidth=self.bandwidth
-        )
+        cached = self.__dict__.get("_name")
+        if cached is None:
+            diskCapacities = ",".join(map(str, self.diskCapacities))
+            cached = self.__dict__["_name"] = (
+                f"{self.cpu}xCPU, {self.ram/1024}GB, {len(self.diskCapacities)} "
+                f"{self.diskType} disks ({diskCapacities}), {self.bandwidth}Mbps"
+            )
+        return cached
 
     @name.setter
     def name(self, value):
@@ -1108,7 +1511,7 @@ class SoftLayerOperatingSystemImage(NodeImage):
     def __init__(self, code, name, driver):
         super(SoftLayerOperatingSystemImage, self).__init__(code, name, driver)
 
-def get_additional_sizes(name, options, existingSizes):
+def get_additional_sizes(name, options, existingSizes, driver=None):
     """
     Get a combination of existing sizes with the specified options
 
@@ -1118,16 +1521,20 @@ def get_additional_sizes(name, options, existingSizes):
     :type options: list
     :param existingSizes: existing sizes
     :type existingSizes: [:class:`FyreNodeSize`]
+    :param driver: driver for the new sizes, defaults to each existing size's driver
+    :type driver: :class:`~libcloud.compute.base.NodeDriver`
     :returns: list of new node sizes
     :rtype: [:class:`FyreNodeSize`]
     """
-    newSizes = []
-    for option in options:
-        for size in existingSizes:
-            newSize = copy.deepcopy(size)
-            newSize.extra.update({name:option})
-            newSizes.append(newSize)
-    return newSizes
+    # only the extra dictionary varies, so construct each fresh size with a
+    # shallow merge instead of deep-copying the whole object; the single
+    # comprehension sizes the result list without repeated append calls
+    return [
+        SoftLayerNodeSize(driver or size.driver,
+                          extra=dict(size.extra, **{name: option}))
+        for option in options
+        for size in existingSizes
+    ]
 
 def get_cluster_name(tags):
     """
@@ -1139,8 +1546,8 @@ def get_cluster_name(tags):
     :rtype: str
     """
     for tag in tags:
-        if tag.startswith("storm.cluster.name:"):
-            return tag.replace("storm.cluster.name:", "")
+        if tag.startswith(CLUSTER_NAME_TAG_PREFIX):
+            return tag[_CLUSTER_NAME_TAG_PREFIX_LENGTH:]
     return None
 
 def slcli():
@@ -1150,7 +1557,5 @@ def slcli():
     import SoftLayer.CLI.core
     SoftLayer.CLI.core.main()
 
-set_driver(SoftLayerNodeDriver.type, SoftLayerNodeDriver.__module__, SoftLayerNodeDriver.name)
-
 if __name__ == '__main__':
     slcli()
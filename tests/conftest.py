@@ -1,34 +1,91 @@
+import functools
 import logging
-import os
+from pathlib import Path
 
 import pytest
 
 from libcloud.compute.providers import get_driver
 
+# importing the package registers the driver with libcloud as a side effect
+import storm.drivers.softlayer  # noqa: F401
+
 
 log = logging.getLogger(__name__)
 logging.basicConfig(format='%(asctime)s [%(levelname)s] [%(name)s(%(filename)s:%(lineno)d)] - %(message)s', level=logging.INFO)
 
+# expand the account configuration path once at import time
+SOFTLAYER_CONFIG = Path("~/.softlayer").expanduser()
+
+@functools.lru_cache(maxsize=1)
+def hasSoftLayerConfig():
+    """
+    Check once per session whether account information is available
+    """
+    return SOFTLAYER_CONFIG.is_file()
+
+# constructing a driver reads ~/.softlayer and sets up a SoftLayer API
+# client, so build it once and share it across the whole session
+_driver = None
+
 def getSoftLayerDriver():
-    import storm.drivers.softlayer
-    cls = get_driver("sl")
-    return cls.ex_from_config()
+    global _driver
+    if _driver is None:
+        cls = get_driver("sl")
+        _driver = cls.ex_from_config()
+    return _driver
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def softlayerDriver():
     """
     SoftLayer Cloud driver
     """
-    import storm.drivers.softlayer
-    if not os.path.exists(os.path.expanduser("~/.softlayer")):
+    if not hasSoftLayerConfig():
         pytest.skip("requires ~/.softlayer file with account information")
     return getSoftLayerDriver()
 
 def pytest_generate_tests(metafunc):
+    # parametrize by provider key with indirect resolution so the fixture
+    # below builds (and caches) the actual driver once per session and the
+    # test ids stay stable strings instead of driver reprs
     if "driver" in metafunc.fixturenames:
-        softlayerDriverInstance = getSoftLayerDriver()
-        metafunc.parametrize("driver", [
-                                pytest.mark.skipif(not os.path.exists(os.path.expanduser("~/.softlayer")),
-                                                   reason="requires ~/.softlayer file with account information")
-                                    (softlayerDriverInstance)
-                            ])
+        metafunc.parametrize("driver", ["sl"], indirect=True, ids=["softlayer"])
+
+@pytest.fixture(scope="session")
+def driver(request, softlayerDriver):
+    """
+    Driver under test, resolved from its provider key
+    """
+    if getattr(request, "param", "sl") == "sl":
+        return softlayerDriver
+    raise ValueError("Unknown driver '{0}'".format(request.param))
+
+# share one listing call per kind across the whole session so additional
+# assertions against the same listings do not hit the API again
+
+@pytest.fixture(scope="session")
+def allImages(driver):
+    """
+    Images listed once per session
+    """
+    return driver.list_images()
+
+@pytest.fixture(scope="session")
+def allLocations(driver):
+    """
+    Locations listed once per session
+    """
+    return driver.list_locations()
+
+@pytest.fixture(scope="session")
+def allNodes(driver):
+    """
+    Nodes listed once per session
+    """
+    return driver.list_nodes()
+
+@pytest.fixture(scope="session")
+def allSizes(driver):
+    """
+    Sizes listed once per session
+    """
+    return driver.list_sizes()
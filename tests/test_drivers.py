@@ -2,28 +2,28 @@ import pytest
 
 from libcloud.compute.base import NodeImage, NodeLocation, NodeSize, StorageVolume, Node
 
-def test_list_images(driver):
+def test_list_images(driver, allImages):
 
-    for image in driver.list_images():
+    for image in allImages:
         assert isinstance(image, NodeImage)
         assert image.driver is driver
 
-def test_list_locations(driver):
+def test_list_locations(driver, allLocations):
 
-    for location in driver.list_locations():
+    for location in allLocations:
         assert isinstance(location, NodeLocation)
         assert location.driver is driver
 
-def test_list_nodes(driver):
+def test_list_nodes(driver, allNodes):
 
-    for node in driver.list_nodes():
+    for node in allNodes:
         assert isinstance(node, Node)
         assert node.driver is driver
         assert node.extra["password"]
 
-def test_list_sizes(driver):
+def test_list_sizes(driver, allSizes):
 
-    for size in driver.list_sizes():
+    for size in allSizes:
         assert isinstance(size, NodeSize)
         assert size.driver is driver
 
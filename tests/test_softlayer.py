@@ -4,18 +4,17 @@ def test_vlan(softlayerDriver):
     vlans = softlayerDriver.ex_get_vlans(includePrivate=False, includePublic=False)
     assert len(vlans) == 0
 
-    privateVlans = softlayerDriver.ex_get_vlans(includePrivate=True, includePublic=False)
+    # one listing call serves all three views
+    privateVlans, publicVlans, vlans = softlayerDriver.ex_get_vlans_bulk()
+
     for vlan in privateVlans:
-        subnetIdentifiers = [subnet["networkIdentifier"]
-                             for subnet in vlan.get("subnets", [])]
-        assert all([identifier.startswith("10.") for identifier in subnetIdentifiers])
+        assert all(subnet["networkIdentifier"].startswith("10.")
+                   for subnet in vlan.get("subnets", []))
 
-    publicVlans = softlayerDriver.ex_get_vlans(includePrivate=False, includePublic=True)
     for vlan in publicVlans:
-        subnetIdentifiers = [subnet["networkIdentifier"]
-                             for subnet in vlan.get("subnets", [])]
-        assert all([not identifier.startswith("10.") for identifier in subnetIdentifiers])
+        assert all(not subnet["networkIdentifier"].startswith("10.")
+                   for subnet in vlan.get("subnets", []))
 
     # make sure this includes all private and public vlans
-    vlans = softlayerDriver.ex_get_vlans()
-    assert set([vlan["id"] for vlan in vlans]) == set([vlan["id"] for vlan in privateVlans] + [vlan["id"] for vlan in publicVlans])
+    assert {vlan["id"] for vlan in vlans} == \
+        {vlan["id"] for vlan in privateVlans} | {vlan["id"] for vlan in publicVlans}